@@ -2,76 +2,77 @@
 Configuration module for BugRelay MCP Server.
 """
 
-import os
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseSettings, Field
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class MCPServerConfig(BaseSettings):
     """Configuration for the BugRelay MCP Server."""
-    
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+    )
+
     # BugRelay API configuration
     base_url: str = Field(
         default="http://localhost:8080",
-        env="BUGRELAY_BASE_URL",
+        validation_alias="BUGRELAY_BASE_URL",
         description="Base URL of the BugRelay API"
     )
-    
+
     api_key: Optional[str] = Field(
         default=None,
-        env="BUGRELAY_API_KEY",
+        validation_alias="BUGRELAY_API_KEY",
         description="API key for BugRelay authentication"
     )
-    
+
     # Server configuration
     server_name: str = Field(
         default="bugrelay-mcp-server",
-        env="MCP_SERVER_NAME",
+        validation_alias="MCP_SERVER_NAME",
         description="Name of the MCP server"
     )
-    
+
     server_version: str = Field(
         default="1.0.0",
-        env="MCP_SERVER_VERSION",
+        validation_alias="MCP_SERVER_VERSION",
         description="Version of the MCP server"
     )
-    
+
     # Logging configuration
     log_level: str = Field(
         default="INFO",
-        env="LOG_LEVEL",
+        validation_alias="LOG_LEVEL",
         description="Logging level (DEBUG, INFO, WARNING, ERROR)"
     )
-    
+
     # Request configuration
     request_timeout: int = Field(
         default=30,
-        env="REQUEST_TIMEOUT",
+        validation_alias="REQUEST_TIMEOUT",
         description="HTTP request timeout in seconds"
     )
-    
+
     max_retries: int = Field(
         default=3,
-        env="MAX_RETRIES",
+        validation_alias="MAX_RETRIES",
         description="Maximum number of request retries"
     )
-    
+
     # Authentication configuration
     default_auth_token: Optional[str] = Field(
         default=None,
-        env="DEFAULT_AUTH_TOKEN",
+        validation_alias="DEFAULT_AUTH_TOKEN",
         description="Default authentication token for requests"
     )
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
 def get_config() -> MCPServerConfig:
-    """Get the server configuration."""
+    """Get the server configuration (cached after the first call)."""
     return MCPServerConfig()
-
-
-# Default configuration instance
-config = get_config()
\ No newline at end of file
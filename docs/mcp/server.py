@@ -7,205 +7,400 @@ with the BugRelay backend API.
 """
 
 import asyncio
+import atexit
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 
+import aiofiles
 import httpx
-from mcp.server import Server
+import msgspec
+from cachetools import TTLCache
+from jsonschema import Draft202012Validator
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from config import get_config
+from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import (
-    CallToolRequest,
-    CallToolResult,
-    ListToolsRequest,
-    ListToolsResult,
     Tool,
     TextContent,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Use the libuv event loop when available; falls back to the stdlib loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Configure logging: records are queued and written by a background
+# thread so the event loop never blocks on stderr I/O
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_root_logger = logging.getLogger()
+_root_logger.addHandler(QueueHandler(_log_queue))
+_root_logger.setLevel(get_config().log_level)
 logger = logging.getLogger(__name__)
 
+# Tool definition files shipped alongside this module
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+_TOOL_FILES = ("tools.json", "admin-tools.json", "oauth-tools.json")
+
+# Parsed tool tuples cached on (path, mtime_ns); survives re-instantiation
+_tool_cache: Dict[Tuple[str, int], Tuple[Tool, ...]] = {}
+
+# Methods that are safe to retry after a transient failure
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# OAuth endpoints are GETs but not idempotent reads: the authorization
+# code is single-use and each login mints fresh CSRF state, so their
+# responses are never cached and their requests never retried
+_OAUTH_PATH_PREFIX = "/api/v1/auth/oauth/"
+
+# Table-driven tools: tool name -> (HTTP method, path template, strip_none).
+# Arguments named in the template fill the path; the rest become query
+# params for GETs and the JSON body for everything else. strip_none marks
+# the filter-style tools whose optional arguments may arrive as null and
+# must not be forwarded; everything else passes its arguments through
+# untouched. Paths follow the backend router's /api/v1 groups.
+ROUTES: Dict[str, Tuple[str, str, bool]] = {
+    # The bugs collection is registered as bugs.GET("/")/bugs.POST("/") in
+    # the Go router; the slash-less path only answers with a redirect
+    "create_bug_report": ("POST", "/api/v1/bugs/", False),
+    "get_bug_report": ("GET", "/api/v1/bugs/{bug_id}", False),
+    "search_bug_reports": ("GET", "/api/v1/bugs/", True),
+    "get_admin_dashboard": ("GET", "/api/v1/admin/dashboard", True),
+    "list_bugs_for_moderation": ("GET", "/api/v1/admin/bugs", True),
+    "flag_bug": ("POST", "/api/v1/admin/bugs/{bug_id}/flag", False),
+    "remove_bug": ("DELETE", "/api/v1/admin/bugs/{bug_id}", False),
+    "restore_bug": ("POST", "/api/v1/admin/bugs/{bug_id}/restore", False),
+    "merge_bugs": ("POST", "/api/v1/admin/bugs/merge", False),
+    "get_audit_logs": ("GET", "/api/v1/admin/audit-logs", True),
+    "initiate_oauth_login": ("GET", "/api/v1/auth/oauth/{provider}", True),
+    "handle_oauth_callback": ("GET", "/api/v1/auth/oauth/callback/{provider}", False),
+    "link_oauth_account": ("POST", "/api/v1/auth/oauth/link/{provider}", False),
+}
+
+# Meta-tool that runs several tool calls concurrently; the HTTP/2 client
+# multiplexes the member requests over one connection
+_BATCH_TOOL = Tool(
+    name="batch_execute",
+    description="Execute multiple BugRelay tool calls concurrently",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operations": {
+                "type": "array",
+                "description": "Tool calls to execute concurrently",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string", "description": "Tool name"},
+                        "arguments": {"type": "object", "description": "Tool arguments"},
+                    },
+                    "required": ["tool"],
+                },
+                "minItems": 1,
+            }
+        },
+        "required": ["operations"],
+    },
+)
+
+# Path placeholder names per route, extracted from the templates once
+_ROUTE_PATH_KEYS: Dict[str, frozenset] = {
+    name: frozenset(
+        field for _, field, _, _ in Formatter().parse(template) if field
+    )
+    for name, (_, template, _) in ROUTES.items()
+}
+
+
 class BugRelayMCPServer:
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "client",
+        "access_token",
+        "_api_key_headers",
+        "_auth_headers",
+        "_get_cache",
+        "tools",
+        "_tools_result",
+        "_dispatch",
+        "_validators",
+    )
+
+    def __init__(self, base_url: str = "http://localhost:8080", api_key: Optional[str] = None):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.api_key = api_key
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+            headers={
+                "User-Agent": "BugRelay-MCP-Server/1.0",
+                "Content-Type": "application/json",
+            },
+        )
         self.access_token: Optional[str] = None
-        
-    async def authenticate(self, email: str, password: str) -> Dict[str, Any]:
-        """Authenticate with the BugRelay API"""
-        response = await self.client.post(
-            urljoin(self.base_url, "/auth/login"),
-            json={"email": email, "password": password}
+        # Auth headers are built once, not on every request
+        self._api_key_headers = {"X-API-Key": api_key} if api_key else None
+        self._auth_headers: Optional[Dict[str, str]] = None
+        # Short-lived response cache for idempotent GETs; per-instance so
+        # cached responses never cross an auth boundary
+        self._get_cache: TTLCache = TTLCache(maxsize=512, ttl=5.0)
+        self.tools: Tuple[Tool, ...] = ()
+        # Reused verbatim on every list_tools request; rebuilt only by start()
+        self._tools_result: List[Tool] = []
+        # Input validators compiled once per tool schema by start()
+        self._validators: Dict[str, Draft202012Validator] = {}
+        # Tools that need custom logic beyond a single routed request
+        self._dispatch = {
+            "authenticate_user": self.authenticate,
+            "get_user_profile": self.get_user_profile,
+            "batch_execute": self.batch_execute,
+        }
+
+    async def _execute_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Dispatch a tool call to its route or handler via a dict lookup."""
+        route = ROUTES.get(name)
+        if route is not None and route[2]:
+            # Null-valued optional filters must go before validation: the
+            # schemas type these properties as non-null
+            arguments = {k: v for k, v in arguments.items() if v is not None}
+        validator = self._validators.get(name)
+        if validator is not None:
+            validator.validate(arguments)
+        if route is not None:
+            return await self._execute_route(name, arguments)
+        handler = self._dispatch.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await handler(**arguments)
+
+    async def _execute_route(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a table-driven tool: fill the path, split the remaining args."""
+        method, template, _ = ROUTES[name]
+        path_keys = _ROUTE_PATH_KEYS[name]
+        if path_keys:
+            endpoint = template.format_map(arguments)
+            extra = {k: v for k, v in arguments.items() if k not in path_keys}
+        else:
+            endpoint = template
+            extra = arguments
+        if method == "GET":
+            return await self._make_request(method, endpoint, params=extra)
+        return await self._make_request(method, endpoint, data=extra)
+
+    async def start(self) -> None:
+        """Load tool definitions before the server starts serving requests."""
+        self.tools = tuple(await self._load_tools_async()) + (_BATCH_TOOL,)
+        self._tools_result = list(self.tools)
+        self._validators = {
+            tool.name: Draft202012Validator(tool.inputSchema)
+            for tool in self.tools
+        }
+
+    async def __aenter__(self) -> "BugRelayMCPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.client.aclose()
+
+    async def _load_tools_async(self) -> List[Tool]:
+        """Load tool definitions from the bundled JSON files concurrently."""
+        async def _read(filename: str) -> Tuple[Tool, ...]:
+            path = os.path.join(_TOOLS_DIR, filename)
+            key = (path, os.stat(path).st_mtime_ns)
+            cached = _tool_cache.get(key)
+            if cached is None:
+                async with aiofiles.open(path, "r", encoding="utf-8") as f:
+                    definitions = json.loads(await f.read())
+                cached = tuple(Tool(**definition) for definition in definitions["tools"])
+                _tool_cache[key] = cached
+            return cached
+
+        tools: List[Tool] = []
+        results = await asyncio.gather(
+            *(_read(filename) for filename in _TOOL_FILES),
+            return_exceptions=True,
         )
+        for filename, result in zip(_TOOL_FILES, results):
+            if isinstance(result, FileNotFoundError):
+                logger.warning(f"Tool definition file not found: {filename}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                tools.extend(result)
+        return tools
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make an API request, reusing the precomputed auth headers."""
+        headers = self._auth_headers or self._api_key_headers
+        one_shot = endpoint.startswith(_OAUTH_PATH_PREFIX)
+        cache_key = None
+        if method == "GET" and not one_shot:
+            cache_key = (
+                endpoint,
+                tuple(sorted(params.items())) if params else (),
+                self.access_token or self.api_key,
+            )
+            cached = self._get_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if method in _IDEMPOTENT_METHODS and not one_shot:
+            response = await self._request_with_retry(
+                method, endpoint, data, params, headers
+            )
+        else:
+            response = await self.client.request(
+                method, endpoint, json=data, params=params, headers=headers
+            )
         response.raise_for_status()
-        data = response.json()
-        self.access_token = data.get("access_token")
-        return data
-    
-    def get_headers(self) -> Dict[str, str]:
-        """Get headers with authentication if available"""
-        headers = {"Content-Type": "application/json"}
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        return headers
-    
-    async def create_bug_report(self, **kwargs) -> Dict[str, Any]:
-        """Create a new bug report"""
-        response = await self.client.post(
-            urljoin(self.base_url, "/bugs"),
-            json=kwargs,
-            headers=self.get_headers()
+        result = msgspec.json.decode(response.content)
+        if cache_key is not None:
+            self._get_cache[cache_key] = result
+        elif method != "GET":
+            self._invalidate_cached_gets(endpoint)
+        return result
+
+    def _invalidate_cached_gets(self, endpoint: str) -> None:
+        """Drop cached GET responses under the resource touched by a write."""
+        # Scope to the first segment after /api/v1, e.g. /api/v1/bugs or
+        # /api/v1/admin, so unrelated cached reads survive the write
+        prefix = "/".join(endpoint.split("/", 4)[:4])
+        stale = [key for key in self._get_cache if key[0].startswith(prefix)]
+        for key in stale:
+            del self._get_cache[key]
+
+    @retry(
+        stop=stop_after_attempt(get_config().max_retries),
+        wait=wait_exponential(multiplier=0.1, max=2.0),
+        retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+        reraise=True,
+    )
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        """Issue an idempotent request, retrying transient failures with backoff."""
+        response = await self.client.request(
+            method, endpoint, json=data, params=params, headers=headers
         )
-        response.raise_for_status()
-        return response.json()
-    
-    async def get_bug_report(self, bug_id: str) -> Dict[str, Any]:
-        """Get a bug report by ID"""
-        response = await self.client.get(
-            urljoin(self.base_url, f"/bugs/{bug_id}"),
-            headers=self.get_headers()
+        if response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
+    async def authenticate(self, email: str, password: str) -> Dict[str, Any]:
+        """Authenticate with the BugRelay API"""
+        data = await self._make_request(
+            "POST", "/api/v1/auth/login", data={"email": email, "password": password}
         )
-        response.raise_for_status()
-        return response.json()
-    
-    async def search_bug_reports(self, **kwargs) -> Dict[str, Any]:
-        """Search for bug reports"""
-        params = {k: v for k, v in kwargs.items() if v is not None}
-        response = await self.client.get(
-            urljoin(self.base_url, "/bugs"),
-            params=params,
-            headers=self.get_headers()
+        self.access_token = data.get("access_token")
+        self._auth_headers = (
+            {"Authorization": f"Bearer {self.access_token}"}
+            if self.access_token else None
         )
-        response.raise_for_status()
-        return response.json()
-    
+        return data
+
     async def get_user_profile(self, user_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get user profile information"""
-        endpoint = f"/users/{user_id}" if user_id else "/auth/me"
-        response = await self.client.get(
-            urljoin(self.base_url, endpoint),
-            headers=self.get_headers()
+        """Get the authenticated user's profile information"""
+        if user_id is not None:
+            raise ValueError(
+                "Looking up other users by ID is not supported by the "
+                "BugRelay API; omit user_id to fetch the current profile"
+            )
+        return await self._make_request("GET", "/api/v1/auth/profile")
+
+    async def batch_execute(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        """Execute several tool calls concurrently on the shared client"""
+        results = await asyncio.gather(
+            *(
+                self._execute_tool(op["tool"], op.get("arguments", {}))
+                for op in operations
+            ),
+            return_exceptions=True,
         )
-        response.raise_for_status()
-        return response.json()
+        return [
+            {"error": str(result)} if isinstance(result, BaseException) else result
+            for result in results
+        ]
 
 # Initialize the MCP server
 server = Server("bugrelay-mcp-server")
 bugrelay = BugRelayMCPServer()
 
 @server.list_tools()
-async def handle_list_tools() -> ListToolsResult:
+async def handle_list_tools() -> List[Tool]:
     """List available tools"""
-    tools = [
-        Tool(
-            name="create_bug_report",
-            description="Create a new bug report in the BugRelay system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Bug report title"},
-                    "description": {"type": "string", "description": "Bug description"},
-                    "application_id": {"type": "string", "format": "uuid"},
-                    "priority": {"type": "string", "enum": ["low", "medium", "high", "critical"]},
-                },
-                "required": ["title", "description", "application_id"]
-            }
-        ),
-        Tool(
-            name="get_bug_report",
-            description="Retrieve a bug report by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bug_id": {"type": "string", "format": "uuid"}
-                },
-                "required": ["bug_id"]
-            }
-        ),
-        Tool(
-            name="search_bug_reports",
-            description="Search for bug reports with filters",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"},
-                    "status": {"type": "string", "enum": ["open", "reviewing", "fixed", "wont_fix"]},
-                    "priority": {"type": "string", "enum": ["low", "medium", "high", "critical"]},
-                    "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 20}
-                }
-            }
-        ),
-        Tool(
-            name="authenticate_user",
-            description="Authenticate a user and obtain access token",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email": {"type": "string", "format": "email"},
-                    "password": {"type": "string"}
-                },
-                "required": ["email", "password"]
-            }
-        ),
-        Tool(
-            name="get_user_profile",
-            description="Get user profile information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "format": "uuid"}
-                }
-            }
-        )
-    ]
-    return ListToolsResult(tools=tools)
+    return bugrelay._tools_result
 
 @server.call_tool()
-async def handle_call_tool(request: CallToolRequest) -> CallToolResult:
+async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool execution requests"""
     try:
-        if request.name == "create_bug_report":
-            result = await bugrelay.create_bug_report(**request.arguments)
-        elif request.name == "get_bug_report":
-            result = await bugrelay.get_bug_report(**request.arguments)
-        elif request.name == "search_bug_reports":
-            result = await bugrelay.search_bug_reports(**request.arguments)
-        elif request.name == "authenticate_user":
-            result = await bugrelay.authenticate(**request.arguments)
-        elif request.name == "get_user_profile":
-            result = await bugrelay.get_user_profile(**request.arguments)
-        else:
-            raise ValueError(f"Unknown tool: {request.name}")
-        
-        return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
-        )
-    
+        result = await bugrelay._execute_tool(name, arguments or {})
+        return [
+            TextContent(
+                type="text",
+                text=msgspec.json.format(
+                    msgspec.json.encode(result), indent=2
+                ).decode(),
+            )
+        ]
+
     except Exception as e:
-        logger.error(f"Error executing tool {request.name}: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")]
-        )
+        logger.error(f"Error executing tool {name}: {e}")
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
     """Run the MCP server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="bugrelay-mcp-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=None,
-                    experimental_capabilities=None,
+    async with bugrelay:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="bugrelay-mcp-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    )
                 )
             )
-        )
 
 if __name__ == "__main__":
     asyncio.run(main())